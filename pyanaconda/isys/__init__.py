@@ -25,9 +25,8 @@ except ImportError:
     # up PYTHONPATH and just do this basic import.
     import _isys
 
+import calendar
 import time
-import datetime
-import zoneinfo
 
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
@@ -47,6 +46,29 @@ def set_system_time(secs):
     log.info("System time set to %s UTC", time.asctime(time.gmtime(secs)))
 
 
+def _check_date_time(year, month, day, hour, minute, second):
+    """
+    Check the date and time fields the same way datetime does.
+
+    calendar.timegm() silently normalizes out-of-range fields, so invalid
+    values have to be rejected before it is called.
+
+    :raise ValueError: if some of the fields is out of range
+    """
+    if not 1 <= year <= 9999:
+        raise ValueError("year %s is out of range" % year)
+    if not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12")
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        raise ValueError("day is out of range for month")
+    if not 0 <= hour <= 23:
+        raise ValueError("hour must be in 0..23")
+    if not 0 <= minute <= 59:
+        raise ValueError("minute must be in 0..59")
+    if not 0 <= second <= 59:
+        raise ValueError("second must be in 0..59")
+
+
 def set_system_date_time(year=None, month=None, day=None, hour=None, minute=None,
                          second=None, tz=None):
     """
@@ -58,12 +80,24 @@ def set_system_date_time(year=None, month=None, day=None, hour=None, minute=None
 
     """
 
-    utc = zoneinfo.ZoneInfo(key='UTC')
-    # If no timezone is set, use UTC
+    # If no timezone is set, use UTC. It needs no zone conversion,
+    # so plain epoch math is enough.
     if not tz:
-        tz = utc
-
-    time.tzset()
+        now = time.gmtime()
+        fields = (
+            year if year is not None else now.tm_year,
+            month if month is not None else now.tm_mon,
+            day if day is not None else now.tm_mday,
+            hour if hour is not None else now.tm_hour,
+            minute if minute is not None else now.tm_min,
+            second if second is not None else now.tm_sec,
+        )
+        _check_date_time(*fields)
+        set_system_time(calendar.timegm(fields))
+        return
+
+    # only the timezone-aware path needs datetime, so import it lazily
+    import datetime
 
     # get the right values
     now = datetime.datetime.now(tz)
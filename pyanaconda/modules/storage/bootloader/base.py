@@ -139,7 +139,7 @@ class BootLoaderArguments:
         Merges ip= arguments targeting the same interface as a side effect.
         """
         self._merge_ip()
-        return " ".join(list(self._arguments))
+        return " ".join(self._arguments)
 
     def __iter__(self):
         return iter(self._arguments)
@@ -179,7 +179,7 @@ class BootLoader(object):
 
     # requirements for stage2 devices
     stage2_device = None
-    stage2_device_types = []
+    stage2_device_types = ()
     stage2_raid_levels = []
     stage2_raid_metadata = []
     stage2_raid_member_types = []
@@ -191,7 +191,7 @@ class BootLoader(object):
 
     @property
     def stage2_format_types(self):
-        return ["ext4", "ext3", "ext2"]
+        return ("ext4", "ext3", "ext2")
 
     def __init__(self):
         super().__init__()
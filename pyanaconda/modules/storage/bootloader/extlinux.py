@@ -34,8 +34,8 @@ class EXTLINUX(BootLoader):
     _config_file = "extlinux.conf"
     _config_dir = "/boot/extlinux"
 
-    stage2_format_types = ["ext4", "ext3", "ext2"]
-    stage2_device_types = ["partition"]
+    stage2_format_types = ("ext4", "ext3", "ext2")
+    stage2_device_types = ("partition",)
     stage2_bootable = True
 
     # The extlinux bootloader doesn't have BLS support, the old grubby is needed
@@ -33,6 +33,12 @@ log = get_module_logger(__name__)
 
 __all__ = ["GRUB2", "IPSeriesGRUB2"]
 
+# file systems grub2 can read /boot from, preferred first
+if productName.startswith("Red Hat "):  # pylint: disable=no-member
+    _STAGE2_FORMAT_TYPES = ("xfs", "ext4", "ext3", "ext2")
+else:
+    _STAGE2_FORMAT_TYPES = ("ext4", "ext3", "ext2", "btrfs", "xfs")
+
 
 class SerialConsoleOptions(object):
     """The serial console options."""
@@ -116,7 +122,7 @@ class GRUB2(BootLoader):
     stage2_must_be_primary = False
 
     # requirements for boot devices
-    stage2_device_types = ["partition", "mdarray", "btrfs volume", "btrfs subvolume"]
+    stage2_device_types = ("partition", "mdarray", "btrfs volume", "btrfs subvolume")
     stage2_raid_levels = [raid.RAID0, raid.RAID1, raid.RAID4,
                           raid.RAID5, raid.RAID6, raid.RAID10]
     stage2_raid_member_types = ["partition"]
@@ -184,10 +190,7 @@ class GRUB2(BootLoader):
 
     @property
     def stage2_format_types(self):
-        if productName.startswith("Red Hat "): # pylint: disable=no-member
-            return ["xfs", "ext4", "ext3", "ext2"]
-        else:
-            return ["ext4", "ext3", "ext2", "btrfs", "xfs"]
+        return _STAGE2_FORMAT_TYPES
 
     #
     # grub-related conveniences
@@ -506,10 +509,12 @@ class GRUB2(BootLoader):
         # make sure we don't clobber error/warning lists
         errors = self.errors[:]
         warnings = self.warnings[:]
-        ret = [d for d in devices if self.is_valid_stage2_device(d, linux=False, non_linux=True)]
-        self.errors = errors
-        self.warnings = warnings
-        return bool(ret)
+        try:
+            return any(self.is_valid_stage2_device(d, linux=False, non_linux=True)
+                       for d in devices)
+        finally:
+            self.errors = errors
+            self.warnings = warnings
 
     # Add a warning about certain RAID situations to is_valid_stage2_device
     def is_valid_stage2_device(self, device, linux=True, non_linux=False):
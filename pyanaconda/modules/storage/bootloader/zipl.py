@@ -29,6 +29,12 @@ log = get_module_logger(__name__)
 
 __all__ = ["ZIPL"]
 
+# RHEL defaults to XFS for /boot, other products to ext4
+if productName.startswith("Red Hat "):  # pylint: disable=no-member
+    _STAGE2_FORMAT_TYPES = ("xfs", "ext4", "ext3", "ext2")
+else:
+    _STAGE2_FORMAT_TYPES = ("ext4", "ext3", "ext2", "xfs")
+
 
 class ZIPL(BootLoader):
     """ZIPL."""
@@ -38,14 +44,11 @@ class ZIPL(BootLoader):
     packages = ["s390utils-core"]
 
     # stage2 device requirements
-    stage2_device_types = ["partition"]
+    stage2_device_types = ("partition",)
 
     @property
     def stage2_format_types(self):
-        if productName.startswith("Red Hat "):          # pylint: disable=no-member
-            return ["xfs", "ext4", "ext3", "ext2"]
-        else:
-            return ["ext4", "ext3", "ext2", "xfs"]
+        return _STAGE2_FORMAT_TYPES
 
     image_label_attr = "short_label"
 
@@ -739,3 +739,47 @@ class BootLoaderFactoryTestCase(unittest.TestCase):
             # Get the boot loader instance.
             obj = cls()
             assert isinstance(obj, BootLoader)
+
+
+class GRUB2TestCase(unittest.TestCase):
+    """Test the GRUB2 boot loader."""
+
+    def test_has_windows(self):
+        """Test has_windows."""
+        grub = GRUB2()
+        grub.errors = ["error"]
+        grub.warnings = ["warning"]
+
+        def is_valid(device, linux=True, non_linux=False):
+            grub.errors.append("new error")
+            grub.warnings.append("new warning")
+            return device == "windows"
+
+        # Stop at the first device with Windows.
+        with patch.object(grub, "is_valid_stage2_device", side_effect=is_valid) as check:
+            assert grub.has_windows(["linux", "windows", "other"]) is True
+            assert check.call_count == 2
+
+        assert grub.errors == ["error"]
+        assert grub.warnings == ["warning"]
+
+        # Check all devices if there is no Windows.
+        with patch.object(grub, "is_valid_stage2_device", side_effect=is_valid) as check:
+            assert grub.has_windows(["linux", "other"]) is False
+            assert check.call_count == 2
+
+        assert grub.errors == ["error"]
+        assert grub.warnings == ["warning"]
+
+        # Restore the lists if the check fails.
+        def fail(device, linux=True, non_linux=False):
+            grub.errors.append("new error")
+            grub.warnings.append("new warning")
+            raise OSError("test")
+
+        with patch.object(grub, "is_valid_stage2_device", side_effect=fail):
+            with pytest.raises(OSError):
+                grub.has_windows(["linux"])
+
+        assert grub.errors == ["error"]
+        assert grub.warnings == ["warning"]
@@ -18,6 +18,7 @@
 
 from pyanaconda import timezone, isys
 import unittest
+import pytest
 from unittest.mock import patch
 import zoneinfo
 
@@ -121,3 +122,22 @@ class SystemTime(unittest.TestCase):
             None, None, None, 19, 15, 30, tz=zoneinfo.ZoneInfo(key="Asia/Aden")
         )
         time_mock.assert_called_with(1609517730)
+
+    @patch('pyanaconda.isys.set_system_time')
+    def test_system_time_invalid(self, time_mock):
+        """Test we refuse to set system time to impossible values,
+        with and without timezone, instead of normalizing them.
+        """
+        with pytest.raises(ValueError):
+            isys.set_system_date_time(2021, 2, 31, 0, 0, 0)
+        with pytest.raises(ValueError):
+            isys.set_system_date_time(2021, 2, 31, 0, 0, 0, tz=zoneinfo.ZoneInfo(key="UTC"))
+        with pytest.raises(ValueError):
+            isys.set_system_date_time(2021, 13, 1, 0, 0, 0)
+        with pytest.raises(ValueError):
+            isys.set_system_date_time(2021, 1, 1, 24, 0, 0)
+        with pytest.raises(ValueError):
+            isys.set_system_date_time(
+                2021, 1, 1, 0, 60, 0, tz=zoneinfo.ZoneInfo(key="US/Eastern")
+            )
+        time_mock.assert_not_called()